@@ -3,18 +3,83 @@
 Generate Mebo vs FlatBuffers benchmark report from test outputs.
 
 This script parses Go benchmark outputs and generates a comprehensive
-markdown report. It can also save intermediate CSV files for faster
-regeneration.
+markdown report. Parsed results are cached as pickle snapshots for faster
+regeneration, and can optionally be exported as CSV for inspection.
 """
 
 import argparse
 import csv
 import json
+import mmap
 import os
+import pickle
 import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup; stdlib json handles the same input
+    _json_loads = json.loads
+
+# Go benchmark result line, e.g.
+# "BenchmarkEncode_Mebo/10pts/mebo/delta-none-gorilla-none-8   2514   156576 ns/op   115052 B/op   234 allocs/op"
+_BENCH_RE = re.compile(
+    rb'^(Benchmark\S+)[ \t]+\d+[ \t]+([\d.]+)[ \t]+ns/op[ \t]+(\d+)[ \t]+B/op[ \t]+(\d+)[ \t]+allocs/op',
+    re.MULTILINE,
+)
+
+# The same result line as it appears inside the Output strings of raw go test -json
+# events: tabs are escaped as "\t", and test2json may end one event after the
+# name and carry the numbers in the next, so the gap may cross event boundaries.
+# Names containing JSON escapes are not matched; use --strict-json for those.
+_JSON_SEP = rb'(?:[ ]|\\t)'
+_JSON_BENCH_RE = re.compile(
+    rb'"Output":"(Benchmark[^"\s\\]+)(?:' + _JSON_SEP + rb'|"[^\n]*\n[^\n]*?"Output":")+'
+    rb'\d+' + _JSON_SEP + rb'+([\d.]+)' + _JSON_SEP + rb'+ns/op'
+    + _JSON_SEP + rb'+(\d+)' + _JSON_SEP + rb'+B/op'
+    + _JSON_SEP + rb'+(\d+)' + _JSON_SEP + rb'+allocs/op'
+)
+
+# Benchmark name, e.g. "BenchmarkEncode_Mebo/10pts/mebo/raw-none-raw-none-8" -> (Mebo, 10pts, config)
+_BENCH_NAME_RE = re.compile(r'Benchmark\w+_(\w+)/(\d+pts)/(\S+)')
+
+# TestBlobSizes output, scanned in file order: either a size section header
+# "━━━ 200 Metrics × 10 Points = 2000 Total Points ━━━" (hdr) or a config row
+# "│ mebo/raw-none-raw-none │       35232 │        17.62 │ ..." (row).
+_SIZE_RE = re.compile(
+    r'(?P<hdr>━[ \t]+\d+[ \t]+Metrics[ \t]+×[ \t]+(?P<pts>\d+)[ \t]+Points[ \t]+=[ \t]+\d+[ \t]+Total[ \t]+Points[ \t]+━)'
+    r'|(?P<row>│[ \t]+(?P<cfg>mebo/[\w-]+|fbs-\w+)[ \t]+│[ \t]+(?P<bytes>\d+)[ \t]+│[ \t]+(?P<bpp>[\d.]+)[ \t]+│)'.encode()
+)
+
+# Report template placeholder, e.g. "{{KEY_FINDINGS}}"
+_PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}')
+
+# Rank column icons for the top three sizes
+_RANK_MEDALS = {1: '🥇', 2: '🥈', 3: '🥉'}
+
+# Files smaller than this are read directly; mapping them costs more than it saves.
+_MMAP_MIN_SIZE = 64 * 1024
+
+@contextmanager
+def open_buffer(path: str):
+    """Open a benchmark output file as a read-only bytes-like buffer."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            yield f.read()
+            return
+
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
 class BenchmarkParser:
     """Parse Go test and benchmark outputs."""
 
@@ -28,7 +93,7 @@ class BenchmarkParser:
         'fbs-zstd': 'FBS best',
     }
 
-    def parse_size_test(self, content: str) -> Dict[str, Dict[str, float]]:
+    def parse_size_test(self, content: bytes) -> Dict[str, Dict[str, float]]:
         """Parse TestBlobSizes output.
 
         Returns:
@@ -37,139 +102,155 @@ class BenchmarkParser:
         results = {}
         current_size = None
 
-        for line in content.split('\n'):
-            # Detect size section: "━━━ 200 Metrics × 10 Points = 2000 Total Points ━━━"
-            match = re.search(r'━+\s+(\d+)\s+Metrics\s+×\s+(\d+)\s+Points\s+=\s+\d+\s+Total\s+Points\s+━+', line)
-            if match:
-                current_size = int(match.group(2))
-                continue
-
-            # Parse config line: "│ mebo/raw-none-raw-none │       35232 │        17.62 │ baseline    │        0.0% │"
-            match = re.search(r'│\s+(mebo/[\w-]+|fbs-\w+)\s+│\s+(\d+)\s+│\s+([\d.]+)\s+│', line)
-            if match and current_size:
-                config = match.group(1)
-                size_bytes = int(match.group(2))
-                bytes_per_point = float(match.group(3))
-
+        for match in _SIZE_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == 'hdr':
+                current_size = int(match['pts'])
+            elif kind == 'row' and current_size:
+                # Rows before the first section header have no size to attach to
+                config = match['cfg'].decode()
                 key = f"{config}_{current_size}pts"
                 results[key] = {
                     'config': config,
                     'size_pts': current_size,
-                    'bytes': size_bytes,
-                    'bytes_per_point': bytes_per_point,
+                    'bytes': int(match['bytes']),
+                    'bytes_per_point': float(match['bpp']),
                 }
 
         return results
 
-    def parse_benchmark_output(self, content: str, pattern: str) -> Dict[str, Dict[str, float]]:
+    def parse_benchmark_output(self, content: bytes, pattern: str) -> Dict[str, Dict[str, float]]:
         """Parse go test -bench output for specific pattern.
 
         Returns:
             {benchmark_name: {ns_per_op: float, bytes_per_op: int, allocs_per_op: int}}
         """
-        results = {}
-
-        for line in content.split('\n'):
-            # BenchmarkEncode_Mebo/10pts/mebo/delta-none-gorilla-none-8         	    2514	    156576 ns/op	  115052 B/op	     234 allocs/op
-            if pattern in line and 'ns/op' in line:
-                # Match the actual format: BenchmarkName-N         	    N	    N ns/op	  N B/op	     N allocs/op
-                match = re.match(r'(Benchmark\S+)\s+\d+\s+([\d.]+)\s+ns/op\s+(\d+)\s+B/op\s+(\d+)\s+allocs/op', line)
-                if match:
-                    name = match.group(1)
-                    ns_op = float(match.group(2))
-                    bytes_op = int(match.group(3))
-                    allocs_op = int(match.group(4))
-
-                    # Keep the last (most recent) result for each benchmark
-                    results[name] = {
-                        'ns_per_op': ns_op,
-                        'bytes_per_op': bytes_op,
-                        'allocs_per_op': allocs_op,
-                    }
+        return self._scan_benchmarks(content, pattern)
 
-        return results
-
-    def parse_benchmark_json(self, filepath: str) -> Dict[str, Dict[str, float]]:
+    def parse_benchmark_json(self, filepath: str, strict: bool = False) -> Dict[str, Dict[str, float]]:
         """Parse go test -bench -json output.
 
+        By default the result lines are matched directly in the raw JSON stream
+        without decoding it; strict decodes each output event instead.
+
         Returns:
             {benchmark_name: {ns_per_op: float, bytes_per_op: int, allocs_per_op: int}}
         """
-        results = {}
-
         if not os.path.exists(filepath):
-            return results
+            return {}
 
-        with open(filepath, 'r') as f:
+        if not strict:
+            with open_buffer(filepath) as buf:
+                return self._scan_benchmarks(buf, regex=_JSON_BENCH_RE)
+
+        results = {}
+        # Output fragments of the current, not yet newline-terminated line
+        pending = []
+        with open(filepath, 'rb') as f:
             for line in f:
-                line = line.strip()
-                if not line:
+                # Only output events carry benchmark results; skip decoding the rest
+                if b'"Action":"output"' not in line:
                     continue
 
                 try:
-                    data = json.loads(line)
-                    # Look for benchmark results in the Output field
-                    if data.get('Action') == 'output' and 'Output' in data:
-                        output = data['Output']
-                        # Parse benchmark result lines like: "BenchmarkName-8   100  12345 ns/op  1024 B/op  10 allocs/op"
-                        match = re.match(r'(Benchmark\S+)\s+\d+\s+([\d.]+)\s+ns/op\s+(\d+)\s+B/op\s+(\d+)\s+allocs/op', output)
-                        if match:
-                            name = match.group(1)
-                            ns_op = float(match.group(2))
-                            bytes_op = int(match.group(3))
-                            allocs_op = int(match.group(4))
-
-                            # Keep the last (most recent) result for each benchmark
-                            results[name] = {
-                                'ns_per_op': ns_op,
-                                'bytes_per_op': bytes_op,
-                                'allocs_per_op': allocs_op,
-                            }
-                except json.JSONDecodeError:
+                    data = _json_loads(line)
+                except ValueError:
                     continue
 
+                # test2json may split one result line across several events, so
+                # scan once the line is complete; only that line is kept live.
+                output = data.get('Output')
+                if not output:
+                    continue
+
+                pending.append(output)
+                if output.endswith('\n'):
+                    self._scan_benchmarks(''.join(pending).encode(), results=results)
+                    pending.clear()
+
+        if pending:
+            self._scan_benchmarks(''.join(pending).encode(), results=results)
+
+        return results
+
+    def _scan_benchmarks(self, buf: bytes, pattern: str = '', results: Optional[Dict] = None,
+                         regex: re.Pattern = _BENCH_RE) -> Dict[str, Dict[str, float]]:
+        """Collect benchmark result lines from a raw output buffer into results."""
+        if results is None:
+            results = {}
+
+        for match in regex.finditer(buf):
+            name = match.group(1).decode()
+            if not name.startswith(pattern):
+                continue
+
+            # Keep the last (most recent) result for each benchmark
+            results[name] = {
+                'ns_per_op': float(match.group(2)),
+                'bytes_per_op': int(match.group(3)),
+                'allocs_per_op': int(match.group(4)),
+            }
+
         return results
 
+    def save_to_pickle(self, data: Dict, filepath: str):
+        """Save parsed data as a pickle snapshot for faster regeneration."""
+        with open(filepath, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_from_pickle(self, filepath: str) -> Dict:
+        """Load parsed data from a pickle snapshot."""
+        if not os.path.exists(filepath):
+            return {}
+
+        with open(filepath, 'rb') as f:
+            return pickle.load(f)
+
     def save_to_csv(self, data: Dict, filepath: str):
-        """Save parsed data to CSV for faster regeneration."""
+        """Save parsed data to CSV for human inspection."""
         if not data:
             return
 
+        # Get all unique keys from first item
+        keys = list(next(iter(data.values())).keys())
+
         with open(filepath, 'w', newline='') as f:
-            # Get all unique keys from first item
-            first_item = next(iter(data.values()))
-            fieldnames = ['name'] + list(first_item.keys())
+            writer = csv.writer(f)
+            writer.writerow(['name'] + keys)
+            writer.writerows([(name, *[values[k] for k in keys]) for name, values in data.items()])
+
+def parse_file(path: str, pattern: Optional[str], strict_json: bool = False) -> Dict:
+    """Parse one benchmark output file; pattern is None for TestBlobSizes output."""
+    bp = BenchmarkParser()
+    if pattern is None:
+        with open_buffer(path) as buf:
+            return bp.parse_size_test(buf)
 
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+    if path.endswith('.json'):
+        return bp.parse_benchmark_json(path, strict=strict_json)
 
-            for name, values in data.items():
-                row = {'name': name}
-                row.update(values)
-                writer.writerow(row)
+    with open_buffer(path) as buf:
+        return bp.parse_benchmark_output(buf, pattern)
 
-    def load_from_csv(self, filepath: str) -> Dict:
-        """Load parsed data from CSV."""
-        if not os.path.exists(filepath):
-            return {}
+def parse_files(jobs: Dict[str, Tuple[str, Optional[str]]], strict_json: bool = False) -> Dict[str, Dict]:
+    """Parse independent benchmark output files in parallel worker processes.
 
-        results = {}
-        with open(filepath, 'r', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                name = row.pop('name')
-                # Convert numeric fields
-                for key, val in row.items():
-                    try:
-                        if '.' in val:
-                            row[key] = float(val)
-                        else:
-                            row[key] = int(val)
-                    except ValueError:
-                        pass
-                results[name] = row
+    Args:
+        jobs: {kind: (path, pattern)}, see parse_file()
 
-        return results
+    Returns:
+        {kind: parsed data}
+    """
+    if not jobs:
+        return {}
+
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {}
+        for kind, (path, pattern) in jobs.items():
+            print(f"Parsing {path}")
+            futures[kind] = executor.submit(parse_file, path, pattern, strict_json)
+
+        return {kind: future.result() for kind, future in futures.items()}
 
 def format_time_value(ns: float) -> str:
     """Convert nanoseconds to appropriate unit."""
@@ -182,59 +263,103 @@ def format_time_value(ns: float) -> str:
     else:
         return f"{ns:.0f} ns"
 
-def format_size_table(data: Dict, size_pts: int = 50) -> str:
-    """Generate markdown table for size comparison."""
-    # Filter for specific size
-    filtered = {k: v for k, v in data.items() if v.get('size_pts') == size_pts}
+def index_by_size(data: Dict) -> Dict[int, List[Tuple[str, Dict]]]:
+    """Bucket parsed size results by point count.
+
+    Returns:
+        {size_pts: [(key, item), ...]} in parse order
+    """
+    index = defaultdict(list)
+    for key, item in data.items():
+        index[item['size_pts']].append((key, item))
+
+    return dict(index)
 
+def format_size_row(rank: int, item: Dict, note: str) -> str:
+    """Generate one size comparison table row."""
+    rank_icon = _RANK_MEDALS.get(rank) or f'{rank}th'
+    return f"| **{item['config']}** | **{item['bytes']:,}** | **{item['bytes_per_point']:.2f}** | {rank_icon} | {note} |"
+
+def format_size_table(size_items: List[Tuple[str, Dict]]) -> str:
+    """Generate markdown table for size comparison of one size bucket."""
     # Sort by bytes_per_point
-    sorted_items = sorted(filtered.items(), key=lambda x: x[1]['bytes_per_point'])
+    sorted_items = sorted(size_items, key=lambda x: x[1]['bytes_per_point'])
 
     lines = [
         "| Configuration | Size (bytes) | Bytes/Point | Rank | Notes |",
         "|---------------|--------------|-------------|------|-------|",
     ]
 
-    for rank, (key, item) in enumerate(sorted_items[:10], 1):  # Top 10
-        config = item['config']
-        size_bytes = item['bytes']
-        bpp = item['bytes_per_point']
+    key_configs = BenchmarkParser.KEY_CONFIGS
+    lines += [
+        format_size_row(rank, item, key_configs.get(item['config'], ''))
+        for rank, (key, item) in enumerate(sorted_items[:10], 1)  # Top 10
+    ]
 
-        # Get note
-        note = BenchmarkParser.KEY_CONFIGS.get(config, '')
-        rank_icon = {1: '🥇', 2: '🥈', 3: '🥉'}.get(rank, f'{rank}th')
+    return '\n'.join(lines)
 
-        lines.append(f"| **{config}** | **{size_bytes:,}** | **{bpp:.2f}** | {rank_icon} | {note} |")
+def group_by_config(data: Dict) -> Dict[str, Dict[str, List[Dict[str, float]]]]:
+    """Group benchmark results by configuration and size.
 
-    return '\n'.join(lines)
+    Prefix -bench filters also pick up sibling benchmarks (e.g. BenchmarkEncodeText_*)
+    that reuse the same size/config names, so every sample is kept in parse order.
 
-def format_benchmark_table(data: Dict, sizes: List[str] = ['10pts', '20pts', '50pts']) -> str:
-    """Generate markdown table for benchmark results."""
-    # Group by configuration and size
+    Returns:
+        {config: {size: [{ns_per_op: float, bytes_per_op: int, allocs_per_op: int}, ...]}}
+    """
     configs = {}
     for name, values in data.items():
         # Extract config and size from benchmark name
         # e.g., "BenchmarkEncode_Mebo/10pts/mebo/raw-none-raw-none-8"
-        match = re.match(r'Benchmark\w+_(\w+)/(\d+pts)/(\S+)', name)
+        match = _BENCH_NAME_RE.match(name)
         if match:
-            benchmark_type = match.group(1)  # Mebo or FBS
             size = match.group(2)  # Already includes 'pts'
-            config = match.group(3)
+            config = sys.intern(match.group(3))
 
             if config not in configs:
                 configs[config] = {}
-            configs[config][size] = values['ns_per_op']
+            configs[config].setdefault(size, []).append(values)
+
+    return configs
+
+def format_winner(fastest_sizes: List[str], sizes: List[str]) -> str:
+    """Generate the Winner cell for a config that is fastest in fastest_sizes."""
+    if not fastest_sizes:
+        return ""
+    if len(fastest_sizes) == len(sizes):
+        return "**Fastest**"
+
+    return f"**Fastest ({', '.join(fastest_sizes)})**"
+
+def format_benchmark_row(config: str, size_data: Dict[str, float], sizes: List[str],
+                         fastest_sizes: List[str]) -> str:
+    """Generate one benchmark table row from a config's ns/op per size."""
+    times = [format_time_value(size_data[size]) if size in size_data else "—" for size in sizes]
 
-    # Find the fastest configuration for each size
-    fastest_by_size = {}
+    # Only configs measured at every size compete for the winner label
+    winner = format_winner(fastest_sizes, sizes) if all(size in size_data for size in sizes) else ""
+
+    return "| " + " | ".join([f"**{config}**", *times, winner]) + " |"
+
+def format_benchmark_table(grouped: Dict, sizes: List[str] = ['10pts', '20pts', '50pts']) -> str:
+    """Generate markdown table for benchmark results grouped by group_by_config()."""
+    # Collect timings while tracking the fastest configuration for each size
+    configs = {}
+    fastest_by_size = {}  # {size: (config, ns_per_op)}
+    for config, by_size in grouped.items():
+        size_data = configs[config] = {}
+        for size, samples in by_size.items():
+            # The table shows the last (most recent) result for each size
+            ns = samples[-1]['ns_per_op']
+            size_data[size] = ns
+            if ns < fastest_by_size.get(size, (None, float('inf')))[1]:
+                fastest_by_size[size] = (config, ns)
+
+    # Sizes each configuration is the fastest in
+    wins = {}
     for size in sizes:
-        fastest_config = None
-        fastest_time = float('inf')
-        for config, size_data in configs.items():
-            if size in size_data and size_data[size] < fastest_time:
-                fastest_time = size_data[size]
-                fastest_config = config
-        fastest_by_size[size] = fastest_config
+        if size in fastest_by_size:
+            wins.setdefault(fastest_by_size[size][0], []).append(size)
 
     # Generate table
     lines = [
@@ -242,91 +367,89 @@ def format_benchmark_table(data: Dict, sizes: List[str] = ['10pts', '20pts', '50
         "|---------------|" + "|".join(["-" * 8 for _ in sizes]) + "|--------|",
     ]
 
-    for config, size_data in sorted(configs.items()):
-        row = [f"**{config}**"]
-        for size in sizes:
-            if size in size_data:
-                row.append(format_time_value(size_data[size]))
-            else:
-                row.append("—")
-
-        # Determine winner (fastest overall or by size)
-        times = [size_data.get(size, float('inf')) for size in sizes]
-        if all(t != float('inf') for t in times):
-            # Check if this config is fastest in any size
-            is_fastest_any = any(fastest_by_size.get(size) == config for size in sizes)
-            if is_fastest_any:
-                # Find which sizes this config is fastest in
-                fastest_sizes = [size for size in sizes if fastest_by_size.get(size) == config]
-                if len(fastest_sizes) == len(sizes):
-                    row.append("**Fastest**")
-                elif len(fastest_sizes) > 1:
-                    row.append(f"**Fastest ({', '.join(fastest_sizes)})**")
-                else:
-                    row.append(f"**Fastest ({fastest_sizes[0]})**")
-            else:
-                row.append("")
-        else:
-            row.append("")
-
-        lines.append("| " + " | ".join(row) + " |")
+    lines += [
+        format_benchmark_row(config, size_data, sizes, wins.get(config, []))
+        for config, size_data in sorted(configs.items())
+    ]
 
     return '\n'.join(lines)
 
-def generate_key_findings(sizes_data: Dict, encode_data: Dict, decode_data: Dict, iterate_data: Dict, random_data: Dict) -> str:
+def summarize_by_config(grouped: Dict) -> Dict[str, Dict[str, float]]:
+    """Average every sample grouped by group_by_config() across all sizes.
+
+    Returns:
+        {config: {ns_per_op: float, bytes_per_op: float, allocs_per_op: float}}
+    """
+    summary = {}
+    for config, by_size in grouped.items():
+        n = 0
+        ns = mem = allocs = 0
+        for samples in by_size.values():
+            for values in samples:
+                n += 1
+                ns += values['ns_per_op']
+                mem += values['bytes_per_op']
+                allocs += values['allocs_per_op']
+        summary[config] = {'ns_per_op': ns / n, 'bytes_per_op': mem / n, 'allocs_per_op': allocs / n}
+
+    return summary
+
+def lowest_by(summary: Dict, field: str = 'ns_per_op') -> Tuple[str, float]:
+    """Find the configuration with the lowest average field in a summary.
+
+    Returns:
+        (config, value)
+    """
+    config = min(summary, key=lambda c: summary[c][field])
+    return config, summary[config][field]
+
+def mebo_fbs_averages(summary: Dict, field: str = 'ns_per_op') -> Tuple[Optional[float], Optional[float]]:
+    """Average a summary field separately over Mebo and FBS configurations.
+
+    Returns:
+        (mebo_avg, fbs_avg), with None for a side that has no configurations
+    """
+    mebo_sum = fbs_sum = 0.0
+    mebo_count = fbs_count = 0
+    for config, values in summary.items():
+        value = values[field]
+        if config.startswith('mebo/'):
+            mebo_sum += value
+            mebo_count += 1
+        elif config.startswith('fbs-'):
+            fbs_sum += value
+            fbs_count += 1
+
+    return (mebo_sum / mebo_count if mebo_count else None,
+            fbs_sum / fbs_count if fbs_count else None)
+
+def generate_key_findings(size_items: List[Tuple[str, Dict]], encode_summary: Dict) -> str:
     """Generate dynamic key findings based on actual benchmark data."""
     findings = []
 
     # Size analysis
-    if sizes_data:
+    if size_items:
         # Find best compression
-        size_items = [(k, v) for k, v in sizes_data.items() if v.get('size_pts') == 50]
-        if size_items:
-            best_compression = min(size_items, key=lambda x: x[1]['bytes_per_point'])
-            best_config = best_compression[1]['config']
-            best_bpp = best_compression[1]['bytes_per_point']
-            findings.append(f"- ✅ **Best compression**: `{best_config}` at **{best_bpp:.2f} bytes/point**")
-
-            # Find balanced option (delta-none-gorilla-none)
-            balanced_items = [item for item in size_items if 'delta-none-gorilla-none' in item[1]['config']]
-            if balanced_items:
-                balanced_bpp = balanced_items[0][1]['bytes_per_point']
-                findings.append(f"- ⭐ **Balanced option**: `mebo/delta-none-gorilla-none` at **{balanced_bpp:.2f} bytes/point**")
+        best_compression = min(size_items, key=lambda x: x[1]['bytes_per_point'])
+        best_config = best_compression[1]['config']
+        best_bpp = best_compression[1]['bytes_per_point']
+        findings.append(f"- ✅ **Best compression**: `{best_config}` at **{best_bpp:.2f} bytes/point**")
+
+        # Find balanced option (delta-none-gorilla-none)
+        balanced_items = [item for item in size_items if 'delta-none-gorilla-none' in item[1]['config']]
+        if balanced_items:
+            balanced_bpp = balanced_items[0][1]['bytes_per_point']
+            findings.append(f"- ⭐ **Balanced option**: `mebo/delta-none-gorilla-none` at **{balanced_bpp:.2f} bytes/point**")
 
     # Performance analysis
-    if encode_data:
+    if encode_summary:
         # Find fastest encoding
-        encode_configs = {}
-        for name, values in encode_data.items():
-            match = re.match(r'Benchmark\w+_(\w+)/(\d+pts)/(\S+)', name)
-            if match:
-                config = match.group(3)
-                if config not in encode_configs:
-                    encode_configs[config] = []
-                encode_configs[config].append(values['ns_per_op'])
-
-        if encode_configs:
-            # Calculate average performance
-            avg_perf = {config: sum(times)/len(times) for config, times in encode_configs.items()}
-            fastest_encode = min(avg_perf.items(), key=lambda x: x[1])
-            findings.append(f"- 🚀 **Fastest encoding**: `{fastest_encode[0]}` at **{format_time_value(fastest_encode[1])}** average")
-
-    # Memory analysis
-    if encode_data:
+        fastest_encode = lowest_by(encode_summary)
+        findings.append(f"- 🚀 **Fastest encoding**: `{fastest_encode[0]}` at **{format_time_value(fastest_encode[1])}** average")
+
         # Find lowest memory usage
-        memory_usage = {}
-        for name, values in encode_data.items():
-            match = re.match(r'Benchmark\w+_(\w+)/(\d+pts)/(\S+)', name)
-            if match:
-                config = match.group(3)
-                if config not in memory_usage:
-                    memory_usage[config] = []
-                memory_usage[config].append(values['bytes_per_op'])
-
-        if memory_usage:
-            avg_memory = {config: sum(usage)/len(usage) for config, usage in memory_usage.items()}
-            lowest_memory = min(avg_memory.items(), key=lambda x: x[1])
-            findings.append(f"- 💾 **Lowest memory**: `{lowest_memory[0]}` at **{lowest_memory[1]:,} bytes/op** average")
+        lowest_memory = lowest_by(encode_summary, 'bytes_per_op')
+        findings.append(f"- 💾 **Lowest memory**: `{lowest_memory[0]}` at **{lowest_memory[1]:,} bytes/op** average")
 
     # Add analysis hint if no findings
     if not findings:
@@ -336,143 +459,86 @@ def generate_key_findings(sizes_data: Dict, encode_data: Dict, decode_data: Dict
 
     return '\n'.join(findings)
 
-def generate_iteration_findings(iterate_data: Dict) -> str:
+def generate_iteration_findings(iterate_summary: Dict) -> str:
     """Generate dynamic key findings for Part 4: Iteration Performance."""
     findings = []
 
-    if not iterate_data:
+    if not iterate_summary:
         findings.append("- 📊 **Analysis needed**: Review iteration benchmark data")
         return '\n'.join(findings)
 
     # Analyze iteration performance
-    iterate_configs = {}
-    for name, values in iterate_data.items():
-        match = re.match(r'Benchmark\w+_(\w+)/(\d+pts)/(\S+)', name)
-        if match:
-            config = match.group(3)
-            if config not in iterate_configs:
-                iterate_configs[config] = []
-            iterate_configs[config].append(values['ns_per_op'])
-
-    if iterate_configs:
-        # Calculate average performance
-        avg_perf = {config: sum(times)/len(times) for config, times in iterate_configs.items()}
-        fastest_iterate = min(avg_perf.items(), key=lambda x: x[1])
-        findings.append(f"- 🚀 **Fastest iteration**: `{fastest_iterate[0]}` at **{format_time_value(fastest_iterate[1])}** average")
-
-        # Compare Mebo vs FBS
-        mebo_configs = {k: v for k, v in avg_perf.items() if k.startswith('mebo/')}
-        fbs_configs = {k: v for k, v in avg_perf.items() if k.startswith('fbs-')}
-
-        if mebo_configs and fbs_configs:
-            mebo_avg = sum(mebo_configs.values()) / len(mebo_configs)
-            fbs_avg = sum(fbs_configs.values()) / len(fbs_configs)
-            speedup = fbs_avg / mebo_avg if mebo_avg > 0 else 1
-            findings.append(f"- ⚡ **Mebo advantage**: **{speedup:.1f}× faster** than FBS on average")
-
-        # Find best balanced option
-        balanced_configs = {k: v for k, v in avg_perf.items() if 'delta-none-gorilla-none' in k}
-        if balanced_configs:
-            balanced_perf = list(balanced_configs.values())[0]
-            findings.append(f"- ⭐ **Balanced performance**: `mebo/delta-none-gorilla-none` at **{format_time_value(balanced_perf)}**")
+    fastest_iterate = lowest_by(iterate_summary)
+    findings.append(f"- 🚀 **Fastest iteration**: `{fastest_iterate[0]}` at **{format_time_value(fastest_iterate[1])}** average")
+
+    # Compare Mebo vs FBS
+    mebo_avg, fbs_avg = mebo_fbs_averages(iterate_summary)
+
+    if mebo_avg is not None and fbs_avg is not None:
+        speedup = fbs_avg / mebo_avg if mebo_avg > 0 else 1
+        findings.append(f"- ⚡ **Mebo advantage**: **{speedup:.1f}× faster** than FBS on average")
+
+    # Find best balanced option
+    balanced_perf = next((v['ns_per_op'] for k, v in iterate_summary.items() if 'delta-none-gorilla-none' in k), None)
+    if balanced_perf is not None:
+        findings.append(f"- ⭐ **Balanced performance**: `mebo/delta-none-gorilla-none` at **{format_time_value(balanced_perf)}**")
 
     return '\n'.join(findings)
 
-def generate_decode_iterate_findings(decode_data: Dict) -> str:
+def generate_decode_iterate_findings(decode_summary: Dict) -> str:
     """Generate dynamic key findings for Part 5: Decode + Iteration Combined."""
     findings = []
 
-    if not decode_data:
+    if not decode_summary:
         findings.append("- 📊 **Analysis needed**: Review decode+iteration benchmark data")
         return '\n'.join(findings)
 
     # Analyze combined performance (using decode data as proxy)
-    decode_configs = {}
-    for name, values in decode_data.items():
-        match = re.match(r'Benchmark\w+_(\w+)/(\d+pts)/(\S+)', name)
-        if match:
-            config = match.group(3)
-            if config not in decode_configs:
-                decode_configs[config] = []
-            decode_configs[config].append(values['ns_per_op'])
-
-    if decode_configs:
-        # Calculate average performance
-        avg_perf = {config: sum(times)/len(times) for config, times in decode_configs.items()}
-        fastest_combined = min(avg_perf.items(), key=lambda x: x[1])
-        findings.append(f"- 🚀 **Fastest combined**: `{fastest_combined[0]}` at **{format_time_value(fastest_combined[1])}** average")
-
-        # Compare Mebo vs FBS
-        mebo_configs = {k: v for k, v in avg_perf.items() if k.startswith('mebo/')}
-        fbs_configs = {k: v for k, v in avg_perf.items() if k.startswith('fbs-')}
-
-        if mebo_configs and fbs_configs:
-            mebo_avg = sum(mebo_configs.values()) / len(mebo_configs)
-            fbs_avg = sum(fbs_configs.values()) / len(fbs_configs)
-            speedup = fbs_avg / mebo_avg if mebo_avg > 0 else 1
-            findings.append(f"- ⚡ **Mebo advantage**: **{speedup:.1f}× faster** than FBS for real-world operations")
-
-        # Production recommendation
-        findings.append(f"- 🎯 **Production ready**: Combined operations are **{format_time_value(fastest_combined[1])}** for primary use case")
+    fastest_combined = lowest_by(decode_summary)
+    findings.append(f"- 🚀 **Fastest combined**: `{fastest_combined[0]}` at **{format_time_value(fastest_combined[1])}** average")
+
+    # Compare Mebo vs FBS
+    mebo_avg, fbs_avg = mebo_fbs_averages(decode_summary)
+
+    if mebo_avg is not None and fbs_avg is not None:
+        speedup = fbs_avg / mebo_avg if mebo_avg > 0 else 1
+        findings.append(f"- ⚡ **Mebo advantage**: **{speedup:.1f}× faster** than FBS for real-world operations")
+
+    # Production recommendation
+    findings.append(f"- 🎯 **Production ready**: Combined operations are **{format_time_value(fastest_combined[1])}** for primary use case")
 
     return '\n'.join(findings)
 
-def generate_random_access_findings(random_data: Dict) -> str:
+def generate_random_access_findings(random_summary: Dict) -> str:
     """Generate dynamic key findings for Part 8: Random Access Performance."""
     findings = []
 
-    if not random_data:
+    if not random_summary:
         findings.append("- 📊 **Analysis needed**: Review random access benchmark data")
         return '\n'.join(findings)
 
     # Analyze random access performance
-    random_configs = {}
-    for name, values in random_data.items():
-        match = re.match(r'Benchmark\w+_(\w+)/(\d+pts)/(\S+)', name)
-        if match:
-            config = match.group(3)
-            if config not in random_configs:
-                random_configs[config] = []
-            random_configs[config].append(values['ns_per_op'])
-
-    if random_configs:
-        # Calculate average performance
-        avg_perf = {config: sum(times)/len(times) for config, times in random_configs.items()}
-        fastest_random = min(avg_perf.items(), key=lambda x: x[1])
-        findings.append(f"- 🚀 **Fastest random access**: `{fastest_random[0]}` at **{format_time_value(fastest_random[1])}** average")
-
-        # Compare Mebo vs FBS
-        mebo_configs = {k: v for k, v in avg_perf.items() if k.startswith('mebo/')}
-        fbs_configs = {k: v for k, v in avg_perf.items() if k.startswith('fbs-')}
-
-        if mebo_configs and fbs_configs:
-            mebo_avg = sum(mebo_configs.values()) / len(mebo_configs)
-            fbs_avg = sum(fbs_configs.values()) / len(fbs_configs)
-            if mebo_avg < fbs_avg:
-                speedup = fbs_avg / mebo_avg
-                findings.append(f"- ⚡ **Mebo advantage**: **{speedup:.1f}× faster** than FBS for random access")
-            else:
-                speedup = mebo_avg / fbs_avg
-                findings.append(f"- ⚡ **FBS advantage**: **{speedup:.1f}× faster** than Mebo for random access")
-
-        # Memory efficiency analysis
-        memory_usage = {}
-        for name, values in random_data.items():
-            match = re.match(r'Benchmark\w+_(\w+)/(\d+pts)/(\S+)', name)
-            if match:
-                config = match.group(3)
-                if config not in memory_usage:
-                    memory_usage[config] = []
-                memory_usage[config].append(values['bytes_per_op'])
-
-        if memory_usage:
-            avg_memory = {config: sum(usage)/len(usage) for config, usage in memory_usage.items()}
-            lowest_memory = min(avg_memory.items(), key=lambda x: x[1])
-            findings.append(f"- 💾 **Memory efficient**: `{lowest_memory[0]}` at **{lowest_memory[1]:,} bytes/op**")
+    fastest_random = lowest_by(random_summary)
+    findings.append(f"- 🚀 **Fastest random access**: `{fastest_random[0]}` at **{format_time_value(fastest_random[1])}** average")
+
+    # Compare Mebo vs FBS
+    mebo_avg, fbs_avg = mebo_fbs_averages(random_summary)
+
+    if mebo_avg is not None and fbs_avg is not None:
+        if mebo_avg < fbs_avg:
+            speedup = fbs_avg / mebo_avg
+            findings.append(f"- ⚡ **Mebo advantage**: **{speedup:.1f}× faster** than FBS for random access")
+        else:
+            speedup = mebo_avg / fbs_avg
+            findings.append(f"- ⚡ **FBS advantage**: **{speedup:.1f}× faster** than Mebo for random access")
+
+    # Memory efficiency analysis
+    lowest_memory = lowest_by(random_summary, 'bytes_per_op')
+    findings.append(f"- 💾 **Memory efficient**: `{lowest_memory[0]}` at **{lowest_memory[1]:,} bytes/op**")
 
     return '\n'.join(findings)
 
-def generate_recommendations(sizes_data: Dict, encode_data: Dict, decode_data: Dict, iterate_data: Dict, random_data: Dict) -> str:
+def generate_recommendations(size_items: List[Tuple[str, Dict]], encode_summary: Dict, iterate_summary: Dict) -> str:
     """Generate dynamic recommendations for Part 7 based on actual benchmark data."""
     recommendations = []
 
@@ -480,42 +546,18 @@ def generate_recommendations(sizes_data: Dict, encode_data: Dict, decode_data: D
     best_configs = {}
 
     # Best compression
-    if sizes_data:
-        size_items = [(k, v) for k, v in sizes_data.items() if v.get('size_pts') == 50]
-        if size_items:
-            best_compression = min(size_items, key=lambda x: x[1]['bytes_per_point'])
-            best_configs['compression'] = best_compression[1]['config']
-            best_configs['compression_bpp'] = best_compression[1]['bytes_per_point']
+    if size_items:
+        best_compression = min(size_items, key=lambda x: x[1]['bytes_per_point'])
+        best_configs['compression'] = best_compression[1]['config']
+        best_configs['compression_bpp'] = best_compression[1]['bytes_per_point']
 
     # Fastest encoding
-    if encode_data:
-        encode_configs = {}
-        for name, values in encode_data.items():
-            match = re.match(r'Benchmark\w+_(\w+)/(\d+pts)/(\S+)', name)
-            if match:
-                config = match.group(3)
-                if config not in encode_configs:
-                    encode_configs[config] = []
-                encode_configs[config].append(values['ns_per_op'])
-
-        if encode_configs:
-            avg_perf = {config: sum(times)/len(times) for config, times in encode_configs.items()}
-            best_configs['encoding'] = min(avg_perf.items(), key=lambda x: x[1])[0]
+    if encode_summary:
+        best_configs['encoding'] = lowest_by(encode_summary)[0]
 
     # Fastest iteration
-    if iterate_data:
-        iterate_configs = {}
-        for name, values in iterate_data.items():
-            match = re.match(r'Benchmark\w+_(\w+)/(\d+pts)/(\S+)', name)
-            if match:
-                config = match.group(3)
-                if config not in iterate_configs:
-                    iterate_configs[config] = []
-                iterate_configs[config].append(values['ns_per_op'])
-
-        if iterate_configs:
-            avg_perf = {config: sum(times)/len(times) for config, times in iterate_configs.items()}
-            best_configs['iteration'] = min(avg_perf.items(), key=lambda x: x[1])[0]
+    if iterate_summary:
+        best_configs['iteration'] = lowest_by(iterate_summary)[0]
 
     # Generate recommendations
     recommendations.append("### When to Choose Mebo")
@@ -567,118 +609,95 @@ def main():
     parser.add_argument('--iterate', required=True, help='Iterate benchmark output')
     parser.add_argument('--random', required=True, help='Random access benchmark output')
     parser.add_argument('--output', required=True, help='Output markdown file')
-    parser.add_argument('--artifacts-dir', required=True, help='Directory for CSV artifacts')
+    parser.add_argument('--artifacts-dir', required=True, help='Directory for cached parse artifacts')
+    parser.add_argument('--human-readable', action='store_true', help='Also export parsed data as CSV files')
+    parser.add_argument('--strict-json', action='store_true',
+                        help='Decode every go test -json event instead of scanning the raw stream '
+                             '(cached separately as <kind>.strict.pkl)')
 
     args = parser.parse_args()
 
     bp = BenchmarkParser()
 
-    # Try to load from CSV first (faster), otherwise parse
-    csv_dir = args.artifacts_dir
+    # Try to load from cached snapshots first (faster), otherwise parse
+    artifacts_dir = args.artifacts_dir
 
-    # Parse or load size data
-    size_csv = os.path.join(csv_dir, 'sizes.csv')
-    if os.path.exists(size_csv):
-        print(f"Loading sizes from {size_csv}")
-        sizes_data = bp.load_from_csv(size_csv)
-    else:
-        print(f"Parsing {args.sizes}")
-        with open(args.sizes) as f:
-            sizes_data = bp.parse_size_test(f.read())
-        bp.save_to_csv(sizes_data, size_csv)
-
-    # Parse or load encode data
-    encode_csv = os.path.join(csv_dir, 'encode.csv')
-    if os.path.exists(encode_csv):
-        print(f"Loading encode from {encode_csv}")
-        encode_data = bp.load_from_csv(encode_csv)
-    else:
-        print(f"Parsing {args.encode}")
-        if args.encode.endswith('.json'):
-            encode_data = bp.parse_benchmark_json(args.encode)
-        else:
-            with open(args.encode) as f:
-                encode_content = f.read()
-            encode_data = bp.parse_benchmark_output(encode_content, 'BenchmarkEncode')
-        bp.save_to_csv(encode_data, encode_csv)
-
-    # Parse or load decode data
-    decode_csv = os.path.join(csv_dir, 'decode.csv')
-    if os.path.exists(decode_csv):
-        print(f"Loading decode from {decode_csv}")
-        decode_data = bp.load_from_csv(decode_csv)
-    else:
-        print(f"Parsing {args.decode}")
-        if args.decode.endswith('.json'):
-            decode_data = bp.parse_benchmark_json(args.decode)
-        else:
-            with open(args.decode) as f:
-                decode_content = f.read()
-            decode_data = bp.parse_benchmark_output(decode_content, 'BenchmarkDecode')
-        bp.save_to_csv(decode_data, decode_csv)
-
-    # Parse or load iterate data
-    iterate_csv = os.path.join(csv_dir, 'iterate.csv')
-    if os.path.exists(iterate_csv):
-        print(f"Loading iterate from {iterate_csv}")
-        iterate_data = bp.load_from_csv(iterate_csv)
-    else:
-        print(f"Parsing {args.iterate}")
-        if args.iterate.endswith('.json'):
-            iterate_data = bp.parse_benchmark_json(args.iterate)
-        else:
-            with open(args.iterate) as f:
-                iterate_content = f.read()
-            iterate_data = bp.parse_benchmark_output(iterate_content, 'BenchmarkIterateAll')
-        bp.save_to_csv(iterate_data, iterate_csv)
-
-    # Parse or load random access data
-    random_csv = os.path.join(csv_dir, 'random.csv')
-    if os.path.exists(random_csv):
-        print(f"Loading random from {random_csv}")
-        random_data = bp.load_from_csv(random_csv)
-    else:
-        print(f"Parsing {args.random}")
-        if args.random.endswith('.json'):
-            random_data = bp.parse_benchmark_json(args.random)
+    # (kind, source file, benchmark name prefix; None for TestBlobSizes output)
+    specs = [
+        ('sizes', args.sizes, None),
+        ('encode', args.encode, 'BenchmarkEncode'),
+        ('decode', args.decode, 'BenchmarkDecode'),
+        ('iterate', args.iterate, 'BenchmarkIterateAll'),
+        ('random', args.random, 'BenchmarkRandomAccess'),
+    ]
+
+    # Snapshots of -json outputs are keyed by parse mode too, so --strict-json
+    # never reuses data cached by the raw-stream scanner (or vice versa)
+    snapshots = {
+        kind: os.path.join(artifacts_dir, f'{kind}.strict.pkl' if args.strict_json and path.endswith('.json')
+                           else f'{kind}.pkl')
+        for kind, path, _ in specs
+    }
+
+    # The outputs are independent, so parse every uncached one in parallel
+    jobs = {
+        kind: (path, pattern) for kind, path, pattern in specs
+        if not os.path.exists(snapshots[kind])
+    }
+    parsed = parse_files(jobs, strict_json=args.strict_json)
+
+    data = {}
+    for kind, _, _ in specs:
+        pkl = snapshots[kind]
+        if kind in parsed:
+            data[kind] = parsed[kind]
+            bp.save_to_pickle(data[kind], pkl)
         else:
-            with open(args.random) as f:
-                random_content = f.read()
-            random_data = bp.parse_benchmark_output(random_content, 'BenchmarkRandomAccess')
-        bp.save_to_csv(random_data, random_csv)
+            print(f"Loading {kind} from {pkl}")
+            data[kind] = bp.load_from_pickle(pkl)
+
+        if args.human_readable:
+            bp.save_to_csv(data[kind], os.path.join(artifacts_dir, f'{kind}.csv'))
 
     # Generate tables
-    # Find the most common size in the data
-    size_counts = {}
-    for key, values in sizes_data.items():
-        size = values['size_pts']
-        size_counts[size] = size_counts.get(size, 0) + 1
+    # Bucket size results by point count once; tables and findings index into it
+    sizes_index = index_by_size(data['sizes'])
 
-    # Use the most common size, or 50 if available, or the largest if not
-    primary_size = 50 if 50 in size_counts else max(size_counts.keys()) if size_counts else 50
+    # Use 50 if available, or the largest if not
+    primary_size = 50 if 50 in sizes_index else max(sizes_index.keys()) if sizes_index else 50
+
+    # Group each benchmark set by configuration once, shared by tables and findings
+    bench_kinds = [kind for kind, _, pattern in specs if pattern]
+    grouped = {kind: group_by_config(data[kind]) for kind in bench_kinds}
+    summary = {kind: summarize_by_config(grouped[kind]) for kind in bench_kinds}
 
     # Generate dynamic key findings for all parts
-    key_findings = generate_key_findings(sizes_data, encode_data, decode_data, iterate_data, random_data)
-    iteration_findings = generate_iteration_findings(iterate_data)
-    decode_iterate_findings = generate_decode_iterate_findings(decode_data)
-    random_access_findings = generate_random_access_findings(random_data)
-    recommendations = generate_recommendations(sizes_data, encode_data, decode_data, iterate_data, random_data)
+    key_findings = generate_key_findings(sizes_index.get(50, []), summary['encode'])
+    iteration_findings = generate_iteration_findings(summary['iterate'])
+    decode_iterate_findings = generate_decode_iterate_findings(summary['decode'])
+    random_access_findings = generate_random_access_findings(summary['random'])
+    recommendations = generate_recommendations(sizes_index.get(50, []), summary['encode'], summary['iterate'])
+
+    # Numeric and text sections share the same data for now, so format each table once
+    table_sizes = ['10pts', '20pts', '50pts']
+    size_table = format_size_table(sizes_index.get(primary_size, []))
+    bench_tables = {kind: format_benchmark_table(grouped[kind], table_sizes) for kind in bench_kinds}
 
     tables = {
         'TEST_DATE': datetime.now().strftime('%B %d, %Y'),
         'TEST_SIZES': '200 metrics × [10/20/50/100/200] points',
-        'SIZE_COMPARISON_NUMERIC': format_size_table(sizes_data, size_pts=primary_size),
-        'SIZE_COMPARISON_TEXT': format_size_table(sizes_data, size_pts=primary_size),  # Same for now
-        'ENCODING_NUMERIC': format_benchmark_table(encode_data, ['10pts', '20pts', '50pts']),
-        'ENCODING_TEXT': format_benchmark_table(encode_data, ['10pts', '20pts', '50pts']),  # Same for now
-        'DECODING_NUMERIC': format_benchmark_table(decode_data, ['10pts', '20pts', '50pts']),
-        'DECODING_TEXT': format_benchmark_table(decode_data, ['10pts', '20pts', '50pts']),  # Same for now
-        'ITERATION_NUMERIC': format_benchmark_table(iterate_data, ['10pts', '20pts', '50pts']),
-        'ITERATION_TEXT': format_benchmark_table(iterate_data, ['10pts', '20pts', '50pts']),  # Same for now
-        'DECODE_ITERATE_NUMERIC': format_benchmark_table(decode_data, ['10pts', '20pts', '50pts']),  # Use decode data for now
-        'DECODE_ITERATE_TEXT': format_benchmark_table(decode_data, ['10pts', '20pts', '50pts']),  # Same for now
-        'RANDOM_ACCESS_TEXT': format_benchmark_table(random_data, ['10pts', '20pts', '50pts']),
-        'RANDOM_ACCESS_NUMERIC': format_benchmark_table(random_data, ['10pts', '20pts', '50pts']),
+        'SIZE_COMPARISON_NUMERIC': size_table,
+        'SIZE_COMPARISON_TEXT': size_table,
+        'ENCODING_NUMERIC': bench_tables['encode'],
+        'ENCODING_TEXT': bench_tables['encode'],
+        'DECODING_NUMERIC': bench_tables['decode'],
+        'DECODING_TEXT': bench_tables['decode'],
+        'ITERATION_NUMERIC': bench_tables['iterate'],
+        'ITERATION_TEXT': bench_tables['iterate'],
+        'DECODE_ITERATE_NUMERIC': bench_tables['decode'],  # Use decode data for now
+        'DECODE_ITERATE_TEXT': bench_tables['decode'],
+        'RANDOM_ACCESS_TEXT': bench_tables['random'],
+        'RANDOM_ACCESS_NUMERIC': bench_tables['random'],
         'KEY_FINDINGS': key_findings,
         'ITERATION_FINDINGS': iteration_findings,
         'DECODE_ITERATE_FINDINGS': decode_iterate_findings,
@@ -690,15 +709,15 @@ def main():
     with open(args.template) as f:
         template = f.read()
 
-    for key, value in tables.items():
-        template = template.replace(f'{{{{{key}}}}}', value)
+    # Substitute every placeholder in one pass; unknown ones are left as-is
+    report = _PLACEHOLDER_RE.sub(lambda m: tables.get(m.group(1), m.group(0)), template)
 
     # Write final report
     with open(args.output, 'w') as f:
-        f.write(template)
+        f.write(report)
 
     print(f"✓ Report generated: {args.output}")
-    print(f"✓ CSV artifacts saved in: {csv_dir}")
+    print(f"✓ Artifacts saved in: {artifacts_dir}")
 
 if __name__ == '__main__':
     main()
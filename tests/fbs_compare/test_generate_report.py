@@ -0,0 +1,39 @@
+"""Tests for generate_report.py benchmark parsing."""
+
+import os
+
+from generate_report import BenchmarkParser
+
+# go test -bench -json capture with a name-only header line, b.Logf output
+# between the header and a result, and results split across two events.
+CAPTURE = os.path.join(os.path.dirname(__file__), 'testdata', 'bench_capture.json')
+
+EXPECTED = {
+    'BenchmarkEncode_Mebo/10pts/mebo/delta-none-gorilla-none-8': {
+        'ns_per_op': 156576.0,
+        'bytes_per_op': 115052,
+        'allocs_per_op': 234,
+    },
+    'BenchmarkEncode_Mebo/20pts/mebo/delta-none-gorilla-none-8': {
+        'ns_per_op': 301234.5,
+        'bytes_per_op': 220104,
+        'allocs_per_op': 418,
+    },
+    'BenchmarkEncode_FBS/10pts/fbs-none-8': {
+        'ns_per_op': 1312877.0,
+        'bytes_per_op': 804112,
+        'allocs_per_op': 4021,
+    },
+}
+
+
+def test_parse_benchmark_json_raw_scan_matches_strict():
+    bp = BenchmarkParser()
+
+    fast = bp.parse_benchmark_json(CAPTURE)
+    strict = bp.parse_benchmark_json(CAPTURE, strict=True)
+
+    assert fast
+    assert strict
+    assert fast == strict
+    assert fast == EXPECTED